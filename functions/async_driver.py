@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+class AsyncDriver:
+    """
+    Envoltura awaitable del WebDriver para tasks async
+    
+    Cada operación lenta del driver se ejecuta en el thread pool del event loop
+    para no bloquearlo. Como solo hay un navegador, los comandos al driver se
+    serializan con un lock; la concurrencia real se obtiene al combinarlos con
+    llamadas a achat() u otras operaciones de I/O en asyncio.gather().
+    
+    until() mantiene el lock durante toda la espera (hasta default_timeout
+    segundos), así que las demás llamadas a adriver esperan detrás de ella.
+    Los WebElement devueltos por find_element(s) son síncronos y no usan el
+    lock; sus acciones deben ir por run(), ej: await adriver.run(elem.click).
+    """
+    
+    def __init__(self, driver, wait):
+        self.driver = driver
+        self.wait = wait
+        self._lock = threading.Lock()
+    
+    def _locked(self, func, *args, **kwargs):
+        """Ejecutar func con acceso exclusivo al driver"""
+        with self._lock:
+            return func(*args, **kwargs)
+    
+    async def run(self, func, *args, **kwargs):
+        """Ejecutar cualquier función bloqueante del driver fuera del event loop"""
+        return await asyncio.to_thread(self._locked, func, *args, **kwargs)
+    
+    async def get(self, url):
+        """Navegar a una URL"""
+        return await self.run(self.driver.get, url)
+    
+    async def until(self, condition):
+        """Esperar una Expected Condition con el WebDriverWait configurado"""
+        return await self.run(self.wait.until, condition)
+    
+    async def find_element(self, by, value):
+        """Buscar un elemento"""
+        return await self.run(self.driver.find_element, by, value)
+    
+    async def find_elements(self, by, value):
+        """Buscar varios elementos"""
+        return await self.run(self.driver.find_elements, by, value)
+    
+    async def execute_script(self, script, *args):
+        """Ejecutar JavaScript en la página actual"""
+        return await self.run(self.driver.execute_script, script, *args)
+    
+    async def save_screenshot(self, path):
+        """Guardar captura de pantalla"""
+        return await self.run(self.driver.save_screenshot, path)
+    
+    async def page_source(self):
+        """Obtener el HTML de la página actual"""
+        return await self.run(lambda: self.driver.page_source)
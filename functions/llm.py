@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from openai import OpenAI
@@ -81,6 +82,22 @@ def chat(modelo: str, prompt: str) -> dict:
             "tokens_used": 0
         }
 
+async def achat(modelo: str, prompt: str) -> dict:
+    """
+    Versión awaitable de chat() para tasks async
+    
+    La llamada bloqueante a OpenAI se ejecuta en el thread pool del event loop,
+    así varias consultas pueden correr en paralelo con asyncio.gather().
+    
+    Args:
+        modelo (str): Modelo de OpenAI a usar (ej: 'gpt-4o-mini')
+        prompt (str): Prompt a enviar al modelo
+        
+    Returns:
+        dict: Respuesta del modelo en el mismo formato que chat()
+    """
+    return await asyncio.to_thread(chat, modelo, prompt)
+
 # Función auxiliar para debugging
 def test_chat():
     """Función de prueba para verificar que la integración funciona"""
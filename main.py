@@ -4,7 +4,10 @@ import sys
 import json
 import os
 import importlib.util
+import inspect
+import asyncio
 import time
+import contextlib
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -14,12 +17,19 @@ from selenium.webdriver.support import expected_conditions as EC
 import requests
 
 # Importar función de LLM
-from functions.llm import chat
+from functions.llm import chat, achat
+from functions.async_driver import AsyncDriver
 
 # Variables globales para mantener el navegador
 driver = None
 current_task = None
 
+# stdout original, reservado para los registros NDJSON de las tasks generadoras
+ndjson_stdout = sys.stdout
+
+# Destino de los mensajes de main.py (stderr si stdout lleva registros NDJSON)
+log = sys.stdout
+
 def load_presets():
     """Cargar configuración desde presets.json"""
     try:
@@ -51,7 +61,7 @@ def setup_browser(presets):
     
     # Verificar si ya hay un navegador abierto
     if check_existing_browser(port):
-        print("🔄 Detectado navegador existente, reutilizando sesión...")
+        print("🔄 Detectado navegador existente, reutilizando sesión...", file=log)
         try:
             # Conectar al navegador existente
             chrome_options = Options()
@@ -62,11 +72,11 @@ def setup_browser(presets):
             driver = webdriver.Chrome(service=service, options=chrome_options)
             return driver
         except Exception as e:
-            print(f"⚠️  Error conectando al navegador existente: {e}")
-            print("🔄 Creando nueva instancia...")
+            print(f"⚠️  Error conectando al navegador existente: {e}", file=log)
+            print("🔄 Creando nueva instancia...", file=log)
     
     # Crear nueva instancia del navegador
-    print("🌐 Abriendo nueva ventana del navegador...")
+    print("🌐 Abriendo nueva ventana del navegador...", file=log)
     
     chrome_options = Options()
     chrome_options.add_argument(f"--remote-debugging-port={port}")
@@ -94,10 +104,112 @@ def setup_browser(presets):
         
         return driver
     except Exception as e:
-        print(f"❌ Error iniciando Chrome: {e}")
-        print("💡 Asegúrate de que ChromeDriver esté en la ruta correcta")
+        print(f"❌ Error iniciando Chrome: {e}", file=log)
+        print("💡 Asegúrate de que ChromeDriver esté en la ruta correcta", file=log)
         sys.exit(1)
 
+def streams_to_stdout(presets):
+    """Indicar si los registros NDJSON se escriben en stdout"""
+    output = presets.get('stream_output', '-')
+    return not output or output == '-'
+
+def open_stream(presets):
+    """Abrir el destino NDJSON para tasks que hacen yield (stdout o archivo)"""
+    if streams_to_stdout(presets):
+        return ndjson_stdout, False
+    
+    output = presets['stream_output']
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Cada ejecución reemplaza el archivo para no mezclar registros de corridas anteriores
+    return open(output, 'w', encoding='utf-8'), True
+
+class NDJSONWriter:
+    """Escribir cada registro como una línea JSON con buffer acotado"""
+    
+    def __init__(self, presets):
+        self.stream, self.owns_stream = open_stream(presets)
+        try:
+            self.flush_every = max(1, int(presets.get('stream_flush_every', 1)))
+        except (TypeError, ValueError):
+            self.flush_every = 1
+        self.count = 0
+        self.errors = 0
+        self.task_success = None
+    
+    def write(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.stream.flush()
+        
+        # Registrar el resultado reportado por la task
+        if isinstance(record, dict):
+            if record.get('type') == 'error':
+                self.errors += 1
+            elif record.get('type') == 'summary' and 'success' in record:
+                self.task_success = bool(record['success'])
+    
+    def close(self, completed=True):
+        self.stream.flush()
+        if self.owns_stream:
+            self.stream.close()
+        
+        # Sin registro summary, la task es exitosa si terminó sin errores
+        if self.task_success is None:
+            success = completed and self.errors == 0
+        else:
+            success = completed and self.task_success
+        
+        return {
+            "success": success,
+            "records_written": self.count,
+            "errors": self.errors,
+            "output": self.stream.name
+        }
+
+def progress_output(presets):
+    """Enviar el progreso legible a stderr cuando stdout lleva registros NDJSON"""
+    if streams_to_stdout(presets):
+        return contextlib.redirect_stdout(sys.stderr)
+    return contextlib.nullcontext()
+
+def stream_task(generator_task):
+    """Adaptar una task generadora para que escriba cada yield como NDJSON"""
+    def task_function(presets, selenium_objects):
+        writer = NDJSONWriter(presets)
+        completed = False
+        try:
+            with progress_output(presets):
+                for record in generator_task(presets, selenium_objects):
+                    writer.write(record)
+            completed = True
+        finally:
+            summary = writer.close(completed)
+        return summary
+    task_function.streams_ndjson = True
+    return task_function
+
+def stream_async_task(generator_task):
+    """Adaptar una task generadora async para que escriba cada yield como NDJSON"""
+    async def consume(presets, selenium_objects):
+        writer = NDJSONWriter(presets)
+        completed = False
+        try:
+            with progress_output(presets):
+                async for record in generator_task(presets, selenium_objects):
+                    writer.write(record)
+            completed = True
+        finally:
+            summary = writer.close(completed)
+        return summary
+    
+    def task_function(presets, selenium_objects):
+        return asyncio.run(consume(presets, selenium_objects))
+    task_function.streams_ndjson = True
+    return task_function
+
 def import_task(task_name):
     """Importar dinámicamente la función task desde el archivo especificado"""
     try:
@@ -118,38 +230,60 @@ def import_task(task_name):
             print(f"❌ Error: La task '{task_name}' no tiene función task()")
             return None
         
-        return task_module.task
+        task_function = task_module.task
+        
+        # Si la task es async def, ejecutarla en un event loop
+        if inspect.iscoroutinefunction(task_function):
+            print("⚡ Task async detectada, se ejecutará en un event loop")
+            async_task = task_function
+            def task_function(presets, selenium_objects):
+                return asyncio.run(async_task(presets, selenium_objects))
+        
+        # Si la task hace yield, escribir cada registro como NDJSON al producirse
+        elif inspect.isasyncgenfunction(task_function):
+            print("📡 Task generadora async detectada, resultados en streaming NDJSON", file=sys.stderr)
+            task_function = stream_async_task(task_function)
+        elif inspect.isgeneratorfunction(task_function):
+            print("📡 Task generadora detectada, resultados en streaming NDJSON", file=sys.stderr)
+            task_function = stream_task(task_function)
+        
+        return task_function
     except Exception as e:
         print(f"❌ Error importando task '{task_name}': {e}")
         return None
 
 def main():
     """Función principal"""
-    global driver, current_task
-    
-    print("🚀 Iniciando sistema de automatización web...")
+    global driver, current_task, log
     
     # 1. Verificar argumentos
     if len(sys.argv) != 2:
+        print("🚀 Iniciando sistema de automatización web...")
         print("❌ Error: Debes proporcionar el nombre de una task")
         print("💡 Uso: python main.py <nombre_de_task>")
         sys.exit(1)
     
     task_name = sys.argv[1]
-    print(f"📋 Task seleccionada: {task_name}")
     
     # 2. Cargar configuración
-    print("⚙️  Cargando configuración...")
     presets = load_presets()
     
     # 3. Importar función de task
-    print(f"📦 Importando task '{task_name}'...")
     task_function = import_task(task_name)
     if not task_function:
         sys.exit(1)
     
+    # Si la task escribe NDJSON en stdout, los mensajes de main.py van a stderr
+    if getattr(task_function, 'streams_ndjson', False) and streams_to_stdout(presets):
+        log = sys.stderr
+    
+    print("🚀 Iniciando sistema de automatización web...", file=log)
+    print(f"📋 Task seleccionada: {task_name}", file=log)
+    print("⚙️  Configuración cargada", file=log)
+    print(f"📦 Task '{task_name}' importada", file=log)
+    
     # 4. Configurar navegador
-    print("🌐 Configurando navegador...")
+    print("🌐 Configurando navegador...", file=log)
     driver = setup_browser(presets)
     current_task = task_name
     
@@ -162,31 +296,37 @@ def main():
         'wait': wait,
         'By': By,
         'EC': EC,
-        'chat': chat  # Incluir función de LLM
+        'chat': chat,  # Incluir función de LLM
+        # Versiones awaitable para tasks async
+        'achat': achat,
+        'adriver': AsyncDriver(driver, wait)
     }
     
     # 6. Ejecutar task
-    print(f"🎯 Ejecutando task '{task_name}'...")
+    print(f"🎯 Ejecutando task '{task_name}'...", file=log)
     try:
         result = task_function(presets, selenium_objects)
-        print("✅ Task ejecutada exitosamente")
+        if isinstance(result, dict) and result.get('success') is False:
+            print("⚠️  Task finalizada con errores", file=log)
+        else:
+            print("✅ Task ejecutada exitosamente", file=log)
         if result:
-            print(f"📊 Resultado: {result}")
+            print(f"📊 Resultado: {result}", file=log)
     except Exception as e:
-        print(f"❌ Error ejecutando task: {e}")
+        print(f"❌ Error ejecutando task: {e}", file=log)
         import traceback
         traceback.print_exc()
     
     # 7. Mantener navegador abierto
-    print("🎪 Navegador mantenido abierto para inspección manual")
-    print("💡 Cierra el navegador manualmente cuando hayas terminado")
+    print("🎪 Navegador mantenido abierto para inspección manual", file=log)
+    print("💡 Cierra el navegador manualmente cuando hayas terminado", file=log)
     
     # Mantener el script vivo para no perder la referencia del driver
     try:
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
-        print("\n👋 Cerrando sistema...")
+        print("\n👋 Cerrando sistema...", file=log)
         if driver:
             driver.quit()
 
@@ -14,6 +14,7 @@ def task(presets, selenium_objects):
     - Análisis de múltiples páginas
     - Toma de decisiones automática
     - Manejo robusto de errores
+    - Streaming de resultados parciales (cada yield se escribe como NDJSON)
     """
     
     # Extraer objetos
@@ -25,13 +26,11 @@ def task(presets, selenium_objects):
     
     print("🔍 Iniciando búsqueda inteligente...")
     
-    results = {
-        "success": False,
-        "searches_performed": [],
-        "analysis": {},
-        "screenshots": [],
-        "errors": []
-    }
+    # Solo se guarda el resumen de cada búsqueda; los resultados completos
+    # se emiten con yield en cuanto están disponibles
+    results_summary = []
+    total_results = 0
+    analysis = {}
     
     try:
         # 1. Usar LLM para generar estrategia de búsqueda
@@ -52,8 +51,8 @@ def task(presets, selenium_objects):
         strategy_response = chat(presets['openai_model'], strategy_prompt)
         
         if not strategy_response['success']:
-            results['errors'].append("Error generando estrategia de búsqueda")
-            return results
+            yield {"type": "error", "error": "Error generando estrategia de búsqueda"}
+            return
         
         strategy = strategy_response['data']
         search_terms = strategy.get('search_terms', ['Python automation', 'AI trends 2024', 'Web scraping tools'])
@@ -61,9 +60,9 @@ def task(presets, selenium_objects):
         print(f"📋 Estrategia: {strategy.get('strategy', 'Búsqueda general')}")
         print(f"🎯 Términos a buscar: {', '.join(search_terms)}")
         
-        # 2. Realizar búsquedas múltiples
-        all_search_results = []
+        yield {"type": "strategy", "data": strategy, "search_terms": search_terms}
         
+        # 2. Realizar búsquedas múltiples
         for i, term in enumerate(search_terms, 1):
             print(f"\n🔍 Búsqueda {i}/3: '{term}'")
             
@@ -107,46 +106,43 @@ def task(presets, selenium_objects):
                     except:
                         continue
                 
-                search_data = {
-                    "term": term,
-                    "results": search_results,
-                    "total_found": len(search_results)
-                }
-                
-                all_search_results.append(search_data)
-                results['searches_performed'].append(search_data)
-                
                 print(f"✅ Encontrados {len(search_results)} resultados para '{term}'")
                 
                 # Tomar screenshot de esta búsqueda
                 screenshot_path = f"utils/busqueda_{i}_{int(time.time())}.png"
                 driver.save_screenshot(screenshot_path)
-                results['screenshots'].append(screenshot_path)
+                
+                results_summary.append({
+                    "term": term,
+                    "count": len(search_results),
+                    "titles": [r['title'] for r in search_results[:3]]  # Solo primeros 3
+                })
+                total_results += len(search_results)
+                
+                yield {
+                    "type": "search",
+                    "term": term,
+                    "results": search_results,
+                    "total_found": len(search_results),
+                    "screenshot": screenshot_path
+                }
                 
             except Exception as e:
                 error_msg = f"Error en búsqueda '{term}': {str(e)}"
                 print(f"❌ {error_msg}")
-                results['errors'].append(error_msg)
+                yield {"type": "error", "error": error_msg}
                 continue
         
         # 3. Analizar todos los resultados con LLM
         print("\n🧠 Analizando todos los resultados con LLM...")
         
         analysis_data = {
-            "total_searches": len(all_search_results),
-            "total_results": sum(len(search['results']) for search in all_search_results),
+            "total_searches": len(results_summary),
+            "total_results": total_results,
             "search_terms": search_terms,
-            "results_summary": []
+            "results_summary": results_summary
         }
         
-        for search in all_search_results:
-            summary = {
-                "term": search['term'],
-                "count": search['total_found'],
-                "titles": [r['title'] for r in search['results'][:3]]  # Solo primeros 3
-            }
-            analysis_data['results_summary'].append(summary)
-        
         analysis_prompt = f"""
         Analiza estos resultados de búsqueda sobre tendencias tecnológicas:
         
@@ -167,7 +163,7 @@ def task(presets, selenium_objects):
         
         if analysis_response['success']:
             analysis = analysis_response['data']
-            results['analysis'] = analysis
+            yield {"type": "analysis", "data": analysis}
             
             print("📊 Análisis completado:")
             print(f"   🔥 Tendencias principales: {', '.join(analysis.get('overall_trends', []))}")
@@ -186,7 +182,7 @@ def task(presets, selenium_objects):
         Basándote en toda la información recopilada, crea un reporte ejecutivo conciso.
         
         Datos de búsqueda: {json.dumps(analysis_data, ensure_ascii=False)}
-        Análisis previo: {json.dumps(results.get('analysis', {}), ensure_ascii=False)}
+        Análisis previo: {json.dumps(analysis, ensure_ascii=False)}
         
         Responde con JSON:
         {{
@@ -201,29 +197,28 @@ def task(presets, selenium_objects):
         
         if report_response['success']:
             report = report_response['data']
-            results['final_report'] = report
+            yield {"type": "final_report", "data": report}
             
             print("📄 Reporte ejecutivo:")
             print(f"   📝 {report.get('executive_summary', 'No disponible')}")
             print(f"   🎯 Calidad de investigación: {report.get('research_quality', 'No evaluada')}")
         
         # 5. Finalización exitosa
-        results['success'] = True
-        results['total_searches'] = len(all_search_results)
-        results['total_results'] = sum(len(search['results']) for search in all_search_results)
-        results['execution_time'] = time.time()
+        yield {
+            "type": "summary",
+            "success": True,
+            "total_searches": len(results_summary),
+            "total_results": total_results,
+            "execution_time": time.time()
+        }
         
         print("\n🎉 Búsqueda inteligente completada exitosamente!")
-        print(f"📊 Resumen: {results['total_searches']} búsquedas, {results['total_results']} resultados totales")
-        
-        return results
+        print(f"📊 Resumen: {len(results_summary)} búsquedas, {total_results} resultados totales")
         
     except Exception as e:
         error_msg = f"Error general en task: {str(e)}"
         print(f"❌ {error_msg}")
-        results['errors'].append(error_msg)
-        results['success'] = False
-        return results
+        yield {"type": "error", "error": error_msg}
 
 # Función de prueba
 def test_task():